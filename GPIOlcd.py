@@ -1,456 +1,744 @@
-#!/usr/bin/python
-
-# -------------------------------------------- 
-# GPIOlcd.py
-# --------------------------------------------
-#
-# MIT License
-#
-# Copyright (c) 2020 Michael Schleider
-#
-# Permission is hereby granted, free of charge, to any person obtaining a copy
-# of this software and associated documentation files (the "Software"), to deal
-# in the Software without restriction, including without limitation the rights
-# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
-# copies of the Software, and to permit persons to whom the Software is
-# furnished to do so, subject to the following conditions:
-#
-# The above copyright notice and this permission notice shall be included in all
-# copies or substantial portions of the Software.
-#
-# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
-# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
-# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
-# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
-# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
-# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
-# SOFTWARE.
-#
-
-import RPi.GPIO as GPIO
-import time
-
-class lcd16x2:
-
-    # Pre-Defined Commands
-    _CLEAR = "00000001"
-    _HOME = "00000010"
-    _SETENTRY = "00000110"
-    _SETFUNC = "00111000"
-
-    # Enable pin timing
-    _DELAY = 0.0001
-
-    # Current Cursor Position
-    _CURSORPOS = 0
-
-    # ---
-    #
-    # _textToBinary(str)
-    #
-    # Description:
-    #      Accepted a string to be converted to a list of binary strings
-    #
-    # Returns:
-    #    [str]
-    #
-    # Parameters:
-    #     - text: (str) String of ASCII characters.
-    #
-    # ---
-    def _textToBinary(self, text):
-        binary = []
-        if all(ord(c) < 128 for c in text): # Check if all characters in the string are ASCII-compatable characters
-
-            for c in text:
-
-                byte = str(bin(ord(c))) # Convert curent character to binary
-                byte = byte[2:] # Remove '0b' conversion prefix
-
-                if len(byte) != 8: # If not 8 bits, make it 8 bits
-                    p = 8 - len(byte)
-                    byte = ("0"*p) + byte
-
-                binary.append(byte) # Append to `binary` list
-
-            return binary
-        else:
-            raise ValueError("Text to convert must only contain ASCII characters")
-
-
-
-    # ---
-    #
-    # _sendBinary(str, bool)
-    #
-    # Description:
-    #     Will send binary data through the assigned data pins.
-    #
-    # Parameters:
-    #     - b: (str) Must have length of 8 and consist of characters "0" or "1"
-    #     - isData: (bool) `False` if `b` is to be considered an instruction.
-    #                      `True` if `b` is to be considered an ASCII character.
-    #
-    # ---
-    def _sendBinary(self, b, isData):
-        if type(b) == str: # Ensure `b` is of type str
-            if len(b) == 8: # Ensure `b` is exactly 8 characters long
-                if type(isData) == bool: # Ensure `isData` is of type bool
-
-                    GPIO.output(self._RS, isData) # Set Register select pin
-                    
-                    GPIO.output(self._E, True) # Turn on Enable pin
-                    time.sleep(self._DELAY)
-
-                    # Set each of the data pins
-                    for n in range(len(self._pins)):
-                        GPIO.output(self._pins[7 - n], int(b[n]))
-                        time.sleep(self._DELAY)
-
-                    GPIO.output(self._E, False) # Turn off Enable pin
-                    time.sleep(self._DELAY)
-
-                else:
-                    raise ValueError("Second parameter must be of type `bool`")
-            else:
-                raise ValueError("First parameter must have a string length equal to 8")
-        else:
-            raise ValueError("First parameter must be of type `str`")
-
-
-
-    # ---
-    #
-    # _updateDisplay()
-    #
-    # Description:
-    #     Will update the display's settings to user specification.
-    #
-    # ---
-    def _updateDisplay(self):
-        self._sendBinary("00001" + str(int(self._display)) + str(int(self._cursor)) + str(int(self._blink)), False)
-
-
-    # ---
-    #
-    # clear()
-    #
-    # Description:
-    #     Will clear the display and return the cursor home.
-    #
-    # ---
-    def clear(self):
-        self._CURSORPOS = 0
-        self._sendBinary(self._CLEAR, False) # Clear the display
-        self._sendBinary(self._SETFUNC, False) # Set the function of the display
-        self._updateDisplay() # Set user settings
-        self._sendBinary(self._SETENTRY, False) # Set the entry method of the display
-        self._sendBinary(self._HOME, False) # Return to the home character
-
-    # ---
-    #
-    # __init__(int, int, [int])
-    #
-    # Description:
-    #     Initialize the lcd16x2 object.
-    #
-    # Parameters:
-    #     - RS: (int) BCM Pin Number connected to the Register Select (RS) pin on the LCD Display
-    #     - E: (int) BCM Pin Number connected to the Enable (E/EN) pin on the LCD Display
-    #     - pins: ([int]) List of `int`, representing in order the BCM Pin Numbers connected to pins D0-D7 on the LCD Display
-    #
-    # ---
-    def __init__(self, RS, E, pins):
-        if type(RS) == int: # Ensure RS is of type `int`
-            if type(E) == int: # Ensure E is of type `int`
-                if type(pins) == list: # Ensure pins is of type `list`
-                    if all(type(item) == int for item in pins): # Ensure each item in `list` pins is of type `int`
-                        if len(pins) == 8: # Ensure `list` pins contains exactly 8 elements
-
-                            # Store Instance Variables
-                            self._RS = RS
-                            self._E = E
-                            self._pins = pins
-
-                            # Store default settings
-                            self._display = True # Should the display be on?
-                            self._cursor = False # Should the cursor be enabled?
-                            self._blink = False # Should the display show a blinking cursor?
-
-                            # Set GPIO mode to BCM
-                            GPIO.setmode(GPIO.BCM)
-                            # Ignore GPIO warnings
-                            GPIO.setwarnings(False)
-
-                            # Setup GPIO Pins
-                            for pin in (RS, E): # Register Select and Enable pins
-                                GPIO.setup(pin, GPIO.OUT)
-                                GPIO.output(pin, False)
-
-                            for pin in pins: # D0 - D7 pins
-                                GPIO.setup(pin, GPIO.OUT)
-                                GPIO.output(pin, False)
-
-                            self.clear()
-
-                        else:
-                            raise ValueError("Third parameter (`list` of `int`) must contain exactly 8 elements")
-                    else:
-                        raise ValueError("Third parameter (`list`) must only contain int")
-                else:
-                    raise ValueError("Third parameter must be of type `list`")
-            else:
-                raise ValueError("Second parameter must be of type `int`")
-        else:
-            raise ValueError("First parameter must be of type `int`")
-
-
-
-    # ---
-    #
-    # __del__()
-    #
-    # Description:
-    #     Called when the lcd16x2 object is deinitialized.  Will cleanup GPIO assignments.
-    #
-    # ---
-    def __del__(self):
-        GPIO.cleanup()
-
-
-
-    # ---
-    #
-    # setText(str)
-    #
-    # Description:
-    #     Will set the display's text to user-defined text
-    #
-    # Parameters:
-    #     - text: (str) Text to be displayed on the LCD
-    #
-    # ---
-    def setText(self, text):
-        if type(text) == str:
-            if len(text) <= 32:
-                if len(text) <= 16: # If the text only takes up one line
-                    self.clear()
-
-                    for byte in self._textToBinary(text): # Send text to LCD
-                        self._sendBinary(byte, True)
-                        self._CURSORPOS += 1
-
-                    if self._CURSORPOS == 15: # If it fills up the whole first line, might as well just fill up the null characters
-                        for _ in range(24):
-                            self._sendBinary("00000000", True)
-                            self._CURSORPOS += 1
-
-                else: # If the text will require two lines
-                    self.clear()
-
-                    for byte in self._textToBinary(text[:16]): # Send the first 16 characters
-                        self._sendBinary(byte, True)
-                        self._CURSORPOS += 1
-
-                    for _ in range(24): # Send NULL to fill 17-40
-                        self._sendBinary("00000000", True)
-                        self._CURSORPOS += 1
-
-                    for byte in self._textToBinary(text[16:]): # Send characters from 16 forward
-                        self._sendBinary(byte, True)
-                        self._CURSORPOS += 1
-            else:
-                raise ValueError("Paramter 1 must not have length greater than 32")
-        else:
-            raise ValueError("Paramter 1 must be of type str")
-
-
-
-    # ---
-    #
-    # append(str)
-    #
-    # Description:
-    #     Will set the display's text to user-defined text
-    #
-    # Parameters:
-    #     - text: (str) Text to be appended to the current text on the LCD
-    #
-    # ---
-    def append(self, text):
-        if type(text) == str:
-            if text != "":
-                if (text != "") and (((self._CURSORPOS <= 16) and (self._CURSORPOS + 24 + len(text) <= 56)) or ((self._CURSORPOS >= 39) and (self._CURSORPOS + len(text) <= 56))): # Ensure the text does not excede the limits of the display
-                    for byte in self._textToBinary(text):
-                        if self._CURSORPOS == 16: # If the the first line is filled, send NULL to fill 17-40
-                            for _ in range(24):
-                                self._sendBinary("00000000", True)
-                                self._CURSORPOS += 1
-
-                        if self._CURSORPOS != 16: # Send the text
-                            self._sendBinary(byte, True)
-                            self._CURSORPOS += 1
-
-                else:
-                    raise ValueError("String is too long - total string must not excede 32 characters")
-        else:
-            raise ValueError("Paramter 1 must be of type str")
-
-
-
-    # ---
-    #
-    # setDisplay(bool)
-    #
-    # Description:
-    #     Will set the display either on or off
-    #
-    # Parameters:
-    #     - value: (bool) `True` if display is to be turned on.
-    #                     `False` if display is to be turned off.    
-    #
-    # ---
-    def setDisplay(self, value):
-        if type(value) == bool:
-            self._display = value
-            self._updateDisplay()
-        else:
-            raise ValueError("Paramter 1 must be of type bool")
-
-
-
-    # ---
-    #
-    # setCursor(bool)
-    #
-    # Description:
-    #     Will set the cursor either on or off
-    #
-    # Parameters:
-    #     - value: (bool) `True` if cursor is to be turned on.
-    #                     `False` if cursor is to be turned off.    
-    #
-    # ---
-    def setCursor(self, value):
-        if type(value) == bool:
-            self._cursor = value
-            self._updateDisplay()
-        else:
-            raise ValueError("Paramter 1 must be of type bool")
-
-
-
-    # ---
-    #
-    # setBlink(bool)
-    #
-    # Description:
-    #     Will set the blinking cursor either on or off
-    #
-    # Parameters:
-    #     - value: (bool) `True` if blinking cursor is to be turned on.
-    #                     `False` if blinking cursor is to be turned off.    
-    #
-    # ---
-    def setBlink(self, value):
-        if type(value) == bool:
-            self._blink = value
-            self._updateDisplay()
-        else:
-            raise ValueError("Paramter 1 must be of type bool")
-
-
-
-    # ---
-    #
-    # displayOn()
-    #
-    # Description:
-    #    Will turn on the LCD's display
-    #
-    # See Also:
-    #    - setDisplay
-    #
-    # ---
-    def displayOn(self):
-        self.setDisplay(True)
-
-
-
-    # ---
-    #
-    # displayOff()
-    #
-    # Description:
-    #    Will turn off the LCD's display
-    #
-    # See Also:
-    #    - setDisplay
-    #
-    # ---
-    def displayOff(self):
-        self.setDisplay(False)
-
-
-
-    # ---
-    #
-    # cursorOn()
-    #
-    # Description:
-    #    Will turn on the Cursor
-    #
-    # See Also:
-    #    - setCursor
-    #
-    # ---
-    def cursorOn(self):
-        self.setCursor(True)
-    
-
-
-    # ---
-    #  
-    # cursorOff()
-    #
-    # Description:
-    #    Will turn off the Cursor
-    #
-    # See Also:
-    #    - setCursor
-    #
-    # ---
-    def cursorOff(self):
-        self.setCursor(False)
-
-
-
-    # ---
-    #
-    # blinkOn()
-    #
-    # Description:
-    #    Will turn on the blinking cursor
-    #
-    # See Also:
-    #    - setBlink
-    #
-    # ---
-    def blinkOn(self):
-        self.setBlink(True)
-    
-
-
-    # ---
-    #
-    # blinkOff()
-    #
-    # Description:
-    #    Will turn off the blinking cursor
-    #
-    # See Also:
-    #    - setBlink
-    #
-    # ---
-    def blinkOff(self):
+#!/usr/bin/python
+
+# -------------------------------------------- 
+# GPIOlcd.py
+# --------------------------------------------
+#
+# MIT License
+#
+# Copyright (c) 2020 Michael Schleider
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+#
+
+import functools
+
+import time
+
+# RPi.GPIO is deprecated on kernel 6.6+ and unavailable on the Pi 5, so
+# its absence only matters if the default "gpio" backend is requested
+try:
+    import RPi.GPIO as GPIO
+except ImportError:
+    GPIO = None
+
+# pigpio is only needed for the optional "pigpio" wave backend
+try:
+    import pigpio as _pigpio
+except ImportError:
+    _pigpio = None
+
+# Compile and load the optional Cython fast path for the per-byte
+# bit-bang sequence (_gpiolcd.pyx).  Falls back to the pure-Python
+# implementation when Cython is not installed.
+try:
+    import pyximport
+    pyximport.install(language_level=3)
+    import _gpiolcd
+except ImportError:
+    _gpiolcd = None
+
+# Optional Numba-compiled bulk encoder.  Decomposes a whole array of byte
+# values into (D7..D0) bit rows in one compiled call, removing the
+# per-byte interpreter work from long sequences (full-screen updates,
+# marquee-style scrolling).  Falls back to the lookup table below.
+try:
+    import numpy as _np
+    from numba import njit as _njit
+
+    @_njit(cache=True)
+    def _encodeCodes(codes):
+        out = _np.empty((codes.size, 8), _np.uint8)
+        for i in range(codes.size):
+            v = codes[i]
+            for b in range(8):
+                out[i, 7 - b] = (v >> b) & 1
+        return out
+except ImportError:
+    _encodeCodes = None
+
+# Pre-decomposed byte values.  _BITS_MSB_FIRST[v] is the (D7..D0) bit tuple
+# for byte v, so sending a byte is a single table lookup instead of eight
+# shift/mask operations.  256 x 8 small ints, negligible memory.
+_BITS_MSB_FIRST = tuple(tuple((v >> i) & 1 for i in (7, 6, 5, 4, 3, 2, 1, 0)) for v in range(256))
+
+
+# ---
+#
+# _encodeText(str, int)
+#
+# Description:
+#     Will build the full setText byte sequence for `text`, using `ctl`
+#     as the Display-Control byte.  Results are memoized, so redisplaying
+#     a recently shown string (clocks, menus, status screens) costs a
+#     single cache lookup instead of re-encoding every character.
+#
+# Returns:
+#    ((int, bool))
+#
+# Parameters:
+#     - text: (str) Validated ASCII text, at most 32 characters.
+#     - ctl: (int) Display-Control command byte to embed in the sequence.
+#
+# ---
+@functools.lru_cache(maxsize=64)
+def _encodeText(text, ctl):
+    seq = lcd16x2._initSequence(ctl)
+    seq += [(ord(c), True) for c in text[:16]] # The first 16 characters
+
+    if len(text) > 16: # If the text will require two lines
+        seq.append((0x80 | 0x40, False)) # Jump the cursor to line 2
+        seq += [(ord(c), True) for c in text[16:]] # Characters from 16 forward
+
+    return tuple(seq)
+
+
+class lcd16x2:
+
+    # Pre-Defined Commands
+    _CLEAR = 0x01
+    _HOME = 0x02
+    _SETENTRY = 0x06
+    _SETFUNC = 0x38
+
+    # Enable pin timing, in nanoseconds
+    _E_PULSE_NS = 1000 # E pulse width, HD44780 requires >= 450ns
+    _SETTLE_NS = 40000 # Instruction settle time, HD44780 requires ~37us
+    _CLEAR_SETTLE_NS = 1600000 # Clear/Home settle time, HD44780 requires ~1.52ms
+
+    # Current Cursor DDRAM Address (0x00-0x0F on line 1, 0x40-0x4F on line 2)
+    _cursorAddr = 0x00
+
+    # ---
+    #
+    # _udelay(int)
+    #
+    # Description:
+    #     Will busy-wait for the given number of nanoseconds.  `time.sleep`
+    #     cannot reliably sleep for less than ~100us on the Pi, so short
+    #     hardware delays are spun on the monotonic clock instead.
+    #
+    # Parameters:
+    #     - ns: (int) Number of nanoseconds to wait.
+    #
+    # ---
+    def _udelay(self, ns):
+        end = time.perf_counter_ns() + ns
+        while time.perf_counter_ns() < end:
+            pass
+
+
+
+    # ---
+    #
+    # _sendByte(int, bool)
+    #
+    # Description:
+    #     Will send a byte of data through the assigned data pins.
+    #
+    # Parameters:
+    #     - v: (int) Byte value to send, must be in range 0-255.  Callers are
+    #                trusted, the value is not re-validated here.
+    #     - isData: (bool) `False` if `v` is to be considered an instruction.
+    #                      `True` if `v` is to be considered an ASCII character.
+    #     - bits: ([int]) Optional pre-decomposed (D7..D0) bit row for `v`,
+    #                     looked up from _BITS_MSB_FIRST when omitted.
+    #
+    # ---
+    def _sendByte(self, v, isData, bits=None):
+        if self._backend == "pigpio": # Single-byte wave
+            self._sendWave(((v, isData),))
+            return
+
+        # Clear (0x01) and Home (0x02) execute in ~1.52ms, every other
+        # instruction in ~37us.  Without busy-flag polling the next byte
+        # must wait out the long settle or the controller drops it.
+        settle = self._CLEAR_SETTLE_NS if not isData and v in (0x01, 0x02) else self._SETTLE_NS
+
+        if _gpiolcd is not None: # Compiled fast path, same sequence in C
+            _gpiolcd.send_byte(GPIO.output, self._RS, self._E, self._pins,
+                               v, isData, self._E_PULSE_NS, settle)
+            return
+
+        # Bind hot lookups as locals once, this method runs once per byte
+        # written to the display
+        out = GPIO.output
+        E = self._E
+        udelay = self._udelay
+
+        out(self._RS, isData) # Set Register select pin
+
+        # Set all eight data pins in a single batched call, before E
+        # rises, as the datasheet requires.  `self._pins` is stored
+        # MSB-first (D7..D0), matching the bit order of the lookup table.
+        out(self._pins, _BITS_MSB_FIRST[v] if bits is None else bits)
+
+        out(E, True) # Pulse Enable, the display latches on the falling edge
+        udelay(self._E_PULSE_NS)
+        out(E, False)
+        udelay(settle)
+
+
+
+    # ---
+    #
+    # _sendSequence([(int, bool)])
+    #
+    # Description:
+    #     Will send a pre-built sequence of bytes to the display in one
+    #     pass.  Building the full sequence up front keeps the hot send
+    #     loop free of encoding and branching work.
+    #
+    # Parameters:
+    #     - seq: ([(int, bool)]) Ordered list of (value, isData) pairs.
+    #
+    # ---
+    def _sendSequence(self, seq):
+        if self._backend == "pigpio": # One wave for the whole sequence
+            self._sendWave(seq)
+            return
+
+        send = self._sendByte # Bind the method lookup once for the loop
+
+        # Decompose the whole sequence into bit rows in one compiled call
+        # when Numba is available and the pure-Python byte path is in use
+        if _encodeCodes is not None and _gpiolcd is None and len(seq) > 8:
+            codes = _np.fromiter((v for v, _ in seq), _np.uint8, len(seq))
+            for (v, isData), row in zip(seq, _encodeCodes(codes).tolist()):
+                send(v, isData, row)
+            return
+
+        for v, isData in seq:
+            send(v, isData)
+
+
+
+    # ---
+    #
+    # _sendWave([(int, bool)])
+    #
+    # Description:
+    #     Will send a sequence of bytes as a single pigpio wave.  The wave
+    #     encodes every data-setup/E-pulse/settle step with microsecond
+    #     timing and is DMA-driven by the pigpio daemon, so the whole
+    #     update runs without per-byte Python overhead.
+    #
+    # Parameters:
+    #     - seq: ([(int, bool)]) Ordered list of (value, isData) pairs.
+    #
+    # ---
+    def _sendWave(self, seq):
+        pi = self._pi
+        rsBit = 1 << self._RS
+        eBit = 1 << self._E
+        ePulseUs = max(1, self._E_PULSE_NS // 1000)
+        settleUs = max(1, self._SETTLE_NS // 1000)
+        clearSettleUs = max(1, self._CLEAR_SETTLE_NS // 1000)
+
+        pulses = []
+        for v, isData in seq:
+            # Drive RS and the data pins to their levels for this byte
+            on = rsBit if isData else 0
+            off = 0 if isData else rsBit
+            for pin, bit in zip(self._pins, _BITS_MSB_FIRST[v]):
+                if bit:
+                    on |= 1 << pin
+                else:
+                    off |= 1 << pin
+
+            # Clear (0x01) and Home (0x02) execute in ~1.52ms, so the wave
+            # must hold off that long before clocking in the next byte
+            holdUs = clearSettleUs if not isData and v in (0x01, 0x02) else settleUs
+
+            pulses.append(_pigpio.pulse(on, off, 1)) # Data setup
+            pulses.append(_pigpio.pulse(eBit, 0, ePulseUs)) # E high, display latches on the falling edge
+            pulses.append(_pigpio.pulse(0, eBit, holdUs)) # E low, instruction settle
+
+        pi.wave_add_generic(pulses)
+        wid = pi.wave_create()
+        pi.wave_send_once(wid)
+        while pi.wave_tx_busy(): # Wait for the daemon to finish the wave
+            time.sleep(0.0001) # Each check is a socket round-trip, poll gently
+        pi.wave_delete(wid)
+
+
+
+    # ---
+    #
+    # _setCursor(int)
+    #
+    # Description:
+    #     Will move the cursor to the given DDRAM address in a single
+    #     Set-DDRAM-Address instruction.  Line 1 starts at 0x00, line 2
+    #     at 0x40.
+    #
+    # Parameters:
+    #     - addr: (int) DDRAM address to move the cursor to.
+    #
+    # ---
+    def _setCursor(self, addr):
+        self._sendByte(0x80 | addr, False)
+
+
+
+    # ---
+    #
+    # _recomputeCtl()
+    #
+    # Description:
+    #     Will recompute the cached Display-Control command byte from the
+    #     current user settings.  Called once per settings change so that
+    #     every write path can reuse the cached byte.
+    #
+    # ---
+    def _recomputeCtl(self):
+        self._ctl = 0x08 | (self._display << 2) | (self._cursor << 1) | int(self._blink)
+
+
+
+    # ---
+    #
+    # _initSequence(int)
+    #
+    # Description:
+    #     Will build the clear/setup instruction sequence sent before any
+    #     full-screen update.
+    #
+    # Returns:
+    #    [(int, bool)]
+    #
+    # Parameters:
+    #     - ctl: (int) Display-Control command byte for the user settings.
+    #
+    # ---
+    @staticmethod
+    def _initSequence(ctl):
+        # Datasheet initialization order.  Clear (0x01) already returns the
+        # cursor to address 0x00, so no explicit HOME is needed here.
+        return [(lcd16x2._SETFUNC, False), # Set the function of the display
+                (ctl, False), # Set user settings
+                (lcd16x2._CLEAR, False), # Clear the display
+                (lcd16x2._SETENTRY, False)] # Set the entry method of the display
+
+
+
+    # ---
+    #
+    # _updateDisplay()
+    #
+    # Description:
+    #     Will update the display's settings to user specification.
+    #
+    # ---
+    def _updateDisplay(self):
+        self._sendByte(self._ctl, False)
+
+
+    # ---
+    #
+    # clear()
+    #
+    # Description:
+    #     Will clear the display and return the cursor home.
+    #
+    # ---
+    def clear(self):
+        self._cursorAddr = 0x00
+        self._sendSequence(self._initSequence(self._ctl))
+
+    # ---
+    #
+    # __init__(int, int, [int])
+    #
+    # Description:
+    #     Initialize the lcd16x2 object.
+    #
+    # Parameters:
+    #     - RS: (int) BCM Pin Number connected to the Register Select (RS) pin on the LCD Display
+    #     - E: (int) BCM Pin Number connected to the Enable (E/EN) pin on the LCD Display
+    #     - pins: ([int]) List of `int`, representing in order the BCM Pin Numbers connected to pins D0-D7 on the LCD Display
+    #     - backend: (str) `"gpio"` to bit-bang through RPi.GPIO (default).
+    #                      `"pigpio"` to send DMA-timed waves through the pigpio daemon.
+    #
+    # ---
+    def __init__(self, RS, E, pins, backend="gpio"):
+        # Validate parameters with flat guard clauses
+        if not isinstance(RS, int):
+            raise ValueError("First parameter must be of type `int`")
+        if not isinstance(E, int):
+            raise ValueError("Second parameter must be of type `int`")
+        if not isinstance(pins, list):
+            raise ValueError("Third parameter must be of type `list`")
+        if not all(isinstance(item, int) for item in pins):
+            raise ValueError("Third parameter (`list`) must only contain int")
+        if len(pins) != 8:
+            raise ValueError("Third parameter (`list` of `int`) must contain exactly 8 elements")
+        if backend not in ("gpio", "pigpio"):
+            raise ValueError("Fourth parameter must be \"gpio\" or \"pigpio\"")
+
+        # Store Instance Variables
+        self._RS = RS
+        self._E = E
+        # Stored pre-reversed as a tuple (D7..D0) so _sendByte can pair the
+        # pins with an MSB-first value list without any per-bit indexing
+        self._pins = tuple(reversed(pins))
+
+        self._backend = backend
+        self._closed = False # Has close() released the pins already?
+
+        # Store default settings
+        self._display = True # Should the display be on?
+        self._cursor = False # Should the cursor be enabled?
+        self._blink = False # Should the display show a blinking cursor?
+        self._recomputeCtl() # Cache the Display-Control byte for the defaults
+
+        if backend == "pigpio":
+            if _pigpio is None:
+                raise RuntimeError("The \"pigpio\" backend requires the pigpio package")
+
+            self._pi = _pigpio.pi() # Connect to the pigpio daemon
+            if not self._pi.connected:
+                raise RuntimeError("Could not connect to the pigpio daemon - is pigpiod running?")
+
+            # Setup GPIO Pins (Register Select, Enable, then D0 - D7)
+            for pin in (RS, E, *pins):
+                self._pi.set_mode(pin, _pigpio.OUTPUT)
+                self._pi.write(pin, 0)
+
+        else:
+            if GPIO is None:
+                raise RuntimeError("The \"gpio\" backend requires the RPi.GPIO package")
+
+            # Set GPIO mode to BCM
+            GPIO.setmode(GPIO.BCM)
+            # Ignore GPIO warnings
+            GPIO.setwarnings(False)
+
+            # Setup GPIO Pins (Register Select, Enable, then D0 - D7)
+            setup = GPIO.setup
+            output = GPIO.output
+            for pin in (RS, E, *pins):
+                setup(pin, GPIO.OUT)
+                output(pin, False)
+
+        self.clear()
+
+
+
+    # ---
+    #
+    # close()
+    #
+    # Description:
+    #     Will release the GPIO pins assigned to this display.  Only this
+    #     display's pins are cleaned up, so other LCDs or peripherals on
+    #     the same Pi are left untouched.  Safe to call more than once.
+    #     Prefer calling this explicitly (or using the object as a
+    #     context manager) over relying on garbage collection.
+    #
+    # ---
+    def close(self):
+        if not self._closed:
+            self._closed = True
+            if self._backend == "pigpio":
+                self._pi.stop() # Disconnect from the pigpio daemon
+            else:
+                GPIO.cleanup([self._RS, self._E, *self._pins])
+
+
+
+    # ---
+    #
+    # __enter__()
+    #
+    # Description:
+    #     Allows usage as a context manager, e.g.
+    #     `with lcd16x2(...) as lcd:` - the pins are released
+    #     deterministically when the block exits.
+    #
+    # ---
+    def __enter__(self):
+        return self
+
+
+
+    # ---
+    #
+    # __exit__()
+    #
+    # Description:
+    #     Called when a `with` block exits.  Will cleanup GPIO assignments.
+    #
+    # ---
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+
+
+    # ---
+    #
+    # __del__()
+    #
+    # Description:
+    #     Called when the lcd16x2 object is deinitialized.  Will cleanup
+    #     GPIO assignments if close() was not already called.
+    #
+    # ---
+    def __del__(self):
+        try:
+            self.close()
+        except Exception:
+            pass
+
+
+
+    # ---
+    #
+    # setText(str)
+    #
+    # Description:
+    #     Will set the display's text to user-defined text
+    #
+    # Parameters:
+    #     - text: (str) Text to be displayed on the LCD
+    #
+    # ---
+    def setText(self, text):
+        if isinstance(text, str):
+            if len(text) <= 32:
+                if not text.isascii(): # Check if all characters in the string are ASCII-compatable characters
+                    raise ValueError("Text to display must only contain ASCII characters")
+
+                # Stream the complete (memoized) instruction+data sequence
+                # to the display in a single pass
+                self._sendSequence(_encodeText(text, self._ctl))
+                self._cursorAddr = len(text) if len(text) <= 16 else 0x40 + len(text) - 16
+            else:
+                raise ValueError("Paramter 1 must not have length greater than 32")
+        else:
+            raise ValueError("Paramter 1 must be of type str")
+
+
+
+    # ---
+    #
+    # append(str)
+    #
+    # Description:
+    #     Will set the display's text to user-defined text
+    #
+    # Parameters:
+    #     - text: (str) Text to be appended to the current text on the LCD
+    #
+    # ---
+    def append(self, text):
+        if isinstance(text, str):
+            if text != "":
+                # Number of cells already written (16 per line)
+                addr = self._cursorAddr
+                written = addr if addr < 0x40 else 16 + (addr - 0x40)
+
+                if written + len(text) <= 32: # Ensure the text does not excede the limits of the display
+                    if not text.isascii(): # Check if all characters in the string are ASCII-compatable characters
+                        raise ValueError("Text to display must only contain ASCII characters")
+
+                    for c in text:
+                        if self._cursorAddr == 0x10: # If the first line is filled, jump the cursor to line 2
+                            self._setCursor(0x40)
+                            self._cursorAddr = 0x40
+
+                        self._sendByte(ord(c), True)
+                        self._cursorAddr += 1
+
+                else:
+                    raise ValueError("String is too long - total string must not excede 32 characters")
+        else:
+            raise ValueError("Paramter 1 must be of type str")
+
+
+
+    # ---
+    #
+    # _makeSetter(str)
+    #
+    # Description:
+    #     Will create one of the boolean display-setting setters.  The
+    #     attribute name is closed over at class-definition time, so the
+    #     three setters share a single implementation with no name
+    #     dispatch at call time.
+    #
+    # Parameters:
+    #     - attr: (str) Name of the instance attribute the setter stores to.
+    #
+    # ---
+    def _makeSetter(attr):
+        def setter(self, value):
+            if isinstance(value, bool):
+                setattr(self, attr, value)
+                self._recomputeCtl()
+                self._updateDisplay()
+            else:
+                raise ValueError("Paramter 1 must be of type bool")
+        return setter
+
+
+
+    # ---
+    #
+    # setDisplay(bool)
+    #
+    # Description:
+    #     Will set the display either on or off
+    #
+    # Parameters:
+    #     - value: (bool) `True` if display is to be turned on.
+    #                     `False` if display is to be turned off.
+    #
+    # ---
+    setDisplay = _makeSetter("_display")
+
+
+
+    # ---
+    #
+    # setCursor(bool)
+    #
+    # Description:
+    #     Will set the cursor either on or off
+    #
+    # Parameters:
+    #     - value: (bool) `True` if cursor is to be turned on.
+    #                     `False` if cursor is to be turned off.
+    #
+    # ---
+    setCursor = _makeSetter("_cursor")
+
+
+
+    # ---
+    #
+    # setBlink(bool)
+    #
+    # Description:
+    #     Will set the blinking cursor either on or off
+    #
+    # Parameters:
+    #     - value: (bool) `True` if blinking cursor is to be turned on.
+    #                     `False` if blinking cursor is to be turned off.
+    #
+    # ---
+    setBlink = _makeSetter("_blink")
+
+    del _makeSetter # Only needed while the class body executes
+
+
+
+    # ---
+    #
+    # displayOn()
+    #
+    # Description:
+    #    Will turn on the LCD's display
+    #
+    # See Also:
+    #    - setDisplay
+    #
+    # ---
+    def displayOn(self):
+        self.setDisplay(True)
+
+
+
+    # ---
+    #
+    # displayOff()
+    #
+    # Description:
+    #    Will turn off the LCD's display
+    #
+    # See Also:
+    #    - setDisplay
+    #
+    # ---
+    def displayOff(self):
+        self.setDisplay(False)
+
+
+
+    # ---
+    #
+    # cursorOn()
+    #
+    # Description:
+    #    Will turn on the Cursor
+    #
+    # See Also:
+    #    - setCursor
+    #
+    # ---
+    def cursorOn(self):
+        self.setCursor(True)
+    
+
+
+    # ---
+    #  
+    # cursorOff()
+    #
+    # Description:
+    #    Will turn off the Cursor
+    #
+    # See Also:
+    #    - setCursor
+    #
+    # ---
+    def cursorOff(self):
+        self.setCursor(False)
+
+
+
+    # ---
+    #
+    # blinkOn()
+    #
+    # Description:
+    #    Will turn on the blinking cursor
+    #
+    # See Also:
+    #    - setBlink
+    #
+    # ---
+    def blinkOn(self):
+        self.setBlink(True)
+    
+
+
+    # ---
+    #
+    # blinkOff()
+    #
+    # Description:
+    #    Will turn off the blinking cursor
+    #
+    # See Also:
+    #    - setBlink
+    #
+    # ---
+    def blinkOff(self):
         self.setBlink(False)
\ No newline at end of file
@@ -0,0 +1,48 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+
+# --------------------------------------------
+# _gpiolcd.pyx
+# --------------------------------------------
+#
+# Optional compiled fast path for GPIOlcd.py.  Implements the per-byte
+# bit-bang sequence with C-level integer ops and a C clock_gettime
+# busy-wait, removing the Python interpreter overhead from the hot loop.
+# GPIOlcd.py compiles and imports this via pyximport when Cython is
+# installed and falls back to the pure-Python path otherwise, so the
+# behaviour is identical either way.
+#
+
+from posix.time cimport clock_gettime, timespec, CLOCK_MONOTONIC
+
+
+cdef inline long long _now() nogil:
+    cdef timespec ts
+    clock_gettime(CLOCK_MONOTONIC, &ts)
+    return ts.tv_sec * 1000000000LL + ts.tv_nsec
+
+
+cdef inline void _udelay(long long ns) nogil:
+    cdef long long end = _now() + ns
+    while _now() < end:
+        pass
+
+
+def send_byte(object out, object rs, object e, tuple pins, int v,
+              bint is_data, long e_pulse_ns, long settle_ns):
+    """Send one byte to the display through `out` (GPIO.output).
+
+    `pins` must be the MSB-first (D7..D0) data pin tuple.
+    """
+    cdef int i
+    cdef list values = [0] * 8
+    for i in range(8):
+        values[7 - i] = (v >> i) & 1
+
+    out(rs, is_data) # Set Register select pin
+
+    out(pins, values) # Set all eight data pins before E rises
+
+    out(e, True) # Pulse Enable, the display latches on the falling edge
+    _udelay(e_pulse_ns)
+    out(e, False)
+    _udelay(settle_ns)